@@ -10,106 +10,106 @@ Edit docs/index.html directly — it will not be overwritten on pipeline runs.
 """
 
 import pandas as pd
+import functools
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from clean_team_alias import standardize_team_names, load_team_alias
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
 
-def load_and_standardize_data():
-    data = {}
 
-    net_path = "data_raw/net_rankings.csv"
-    if os.path.exists(net_path):
-        net_df = pd.read_csv(net_path)
-        net_df = standardize_team_names(net_df, "team_net", "net")
-        data["net"] = net_df[["team", "net_rank"]].drop_duplicates(subset=["team"])
-        print(f"Loaded {len(data['net'])} NET rankings")
-
-    kenpom_path = "data_raw/kenpom_rankings.csv"
-    if os.path.exists(kenpom_path):
-        kenpom_df = pd.read_csv(kenpom_path)
-        kenpom_df = standardize_team_names(kenpom_df, "team_kenpom", "kenpom")
-        data["kenpom"] = kenpom_df[["team", "kenpom_rank"]].drop_duplicates(subset=["team"])
-        print(f"Loaded {len(data['kenpom'])} KenPom rankings")
-
-        if "record" in kenpom_df.columns:
-            data["records"] = kenpom_df[["team", "record"]].drop_duplicates(subset=["team"])
-            print(f"Loaded {len(data['records'])} team records (from KenPom)")
-
-    bpi_path = "data_raw/bpi_rankings.csv"
-    if os.path.exists(bpi_path):
-        bpi_df = pd.read_csv(bpi_path)
-        bpi_df = standardize_team_names(bpi_df, "team_bpi", "bpi")
-        data["bpi"] = bpi_df[["team", "bpi_rank"]].drop_duplicates(subset=["team"])
-        print(f"Loaded {len(data['bpi'])} BPI rankings")
-
-    ap_path = "data_raw/ap_rankings.csv"
-    if os.path.exists(ap_path):
-        ap_df = pd.read_csv(ap_path)
-        if not ap_df.empty:
-            ap_df = standardize_team_names(ap_df, "team_ap", "ap")
-            data["ap"] = ap_df[["team", "ap_rank"]].drop_duplicates(subset=["team"])
-            print(f"Loaded {len(data['ap'])} AP rankings")
-
-    sos_path = "data_raw/sos_rankings.csv"
-    if os.path.exists(sos_path):
-        sos_df = pd.read_csv(sos_path)
-        sos_df = standardize_team_names(sos_df, "team_sos", "sos")
-        data["sos"] = sos_df[["team", "sos_rank"]].drop_duplicates(subset=["team"])
-        print(f"Loaded {len(data['sos'])} SOS rankings")
+# (alias source, raw CSV path, raw team column, [(data key, value column, dtype, label), ...])
+SOURCES = [
+    ("net", "data_raw/net_rankings.csv", "team_net", [("net", "net_rank", "Int64", "NET rankings")]),
+    ("kenpom", "data_raw/kenpom_rankings.csv", "team_kenpom", [
+        ("kenpom", "kenpom_rank", "Int64", "KenPom rankings"),
+        ("records", "record", str, "team records (from KenPom)"),
+    ]),
+    ("bpi", "data_raw/bpi_rankings.csv", "team_bpi", [("bpi", "bpi_rank", "Int64", "BPI rankings")]),
+    ("ap", "data_raw/ap_rankings.csv", "team_ap", [("ap", "ap_rank", "Int64", "AP rankings")]),
+    ("sos", "data_raw/sos_rankings.csv", "team_sos", [("sos", "sos_rank", "Int64", "SOS rankings")]),
+]
 
-    return data
 
+@functools.lru_cache(maxsize=32)
+def _read_csv_cached(path: str, mtime_ns: int, dtype_items: tuple) -> pd.DataFrame:
+    dtype = dict(dtype_items)
+    return pd.read_csv(path, usecols=lambda c: c in dtype, dtype=dtype)
 
-def build_master_rankings(data):
-    alias_df = load_team_alias()
-    if alias_df is not None:
-        master = pd.DataFrame({"team": alias_df["canonical"].unique()})
-    else:
-        master = data["net"][["team"]].copy() if "net" in data else pd.DataFrame({"team": []})
 
-    if "records" in data:
-        master = master.merge(data["records"], on="team", how="left")
-    else:
-        master["record"] = ""
+def _read_source_csv(path: str, dtype: dict) -> pd.DataFrame:
+    """Read a raw source CSV, reusing the parsed frame while the file is unchanged."""
+    # shallow copy: callers only add columns, so the cached frame's data is never written
+    return _read_csv_cached(path, os.stat(path).st_mtime_ns, tuple(dtype.items())).copy(deep=False)
 
-    if "ap" in data:
-        master = master.merge(data["ap"], on="team", how="left")
-    else:
-        master["ap_rank"] = None
 
-    if "net" in data:
-        master = master.merge(data["net"], on="team", how="left")
-    else:
-        master["net_rank"] = None
+def load_and_standardize_data():
+    data = {}
 
-    if "kenpom" in data:
-        master = master.merge(data["kenpom"], on="team", how="left")
-    else:
-        master["kenpom_rank"] = None
+    # read_csv releases the GIL while parsing, so the independent source files are read concurrently
+    with ThreadPoolExecutor(max_workers=len(SOURCES)) as executor:
+        reads = {
+            path: executor.submit(
+                _read_source_csv,
+                path,
+                {team_col: str} | {value_col: value_dtype for _, value_col, value_dtype, _ in outputs},
+            )
+            for _, path, team_col, outputs in SOURCES
+            if os.path.exists(path)
+        }
+
+    for source, path, team_col, outputs in SOURCES:
+        if path not in reads:
+            continue
+        df = reads[path].result()
+        if df.empty:
+            continue
+        df = standardize_team_names(df, team_col, source)
+        for key, value_col, _, label in outputs:
+            if value_col not in df.columns:
+                continue
+            data[key] = df[["team", value_col]].drop_duplicates(subset=["team"])
+            print(f"Loaded {len(data[key])} {label}")
+
+    return data
 
-    if "bpi" in data:
-        master = master.merge(data["bpi"], on="team", how="left")
-    else:
-        master["bpi_rank"] = None
 
-    if "sos" in data:
-        master = master.merge(data["sos"], on="team", how="left")
+# (data key, master column, fill value when the source was not loaded)
+MASTER_COLUMNS = [
+    ("records", "record", ""),
+    ("ap", "ap_rank", None),
+    ("net", "net_rank", None),
+    ("kenpom", "kenpom_rank", None),
+    ("bpi", "bpi_rank", None),
+    ("sos", "sos_rank", None),
+]
+
+
+def build_master_rankings(data):
+    alias_df = load_team_alias()
+    if not alias_df.empty:
+        teams = pd.Index(alias_df["canonical"].unique(), name="team")
     else:
-        master["sos_rank"] = None
+        teams = pd.Index(data["net"]["team"] if "net" in data else [], name="team")
+
+    columns = {}
+    for key, col, missing in MASTER_COLUMNS:
+        if key in data:
+            columns[col] = data[key].set_index("team")[col].reindex(teams)
+        else:
+            columns[col] = pd.Series(missing, index=teams, dtype=object)
+    master = pd.DataFrame(columns, index=teams).reset_index()
 
-    def calc_avg_value(row):
-        ranks = []
-        for col in ["net_rank", "kenpom_rank", "bpi_rank"]:
-            val = row.get(col)
-            if pd.notna(val):
-                ranks.append(float(val))
-        if ranks:
-            return round(sum(ranks) / len(ranks), 1)
-        return None
+    rank_cols = ["ap_rank", "net_rank", "kenpom_rank", "bpi_rank", "sos_rank"]
+    master[rank_cols] = master[rank_cols].apply(pd.to_numeric, errors="coerce").astype("Int64")
 
-    master["avg_value"] = master.apply(calc_avg_value, axis=1)
+    avg_cols = ["net_rank", "kenpom_rank", "bpi_rank"]
+    master["avg_value"] = master[avg_cols].astype("float64").mean(axis=1, skipna=True).round(1)
 
     has_ranking = master["net_rank"].notna() | master["kenpom_rank"].notna() | master["bpi_rank"].notna()
     master = master[has_ranking].reset_index(drop=True)
@@ -131,25 +131,27 @@ def _format_updated_est(dt_utc: datetime) -> str:
 
 
 def create_dashboard_json(master_df):
-    records = []
-    for _, row in master_df.iterrows():
-        records.append(
-            {
-                "team": row["team"],
-                "record": row["record"] if pd.notna(row["record"]) else "",
-                "ap_rank": int(row["ap_rank"]) if pd.notna(row["ap_rank"]) else None,
-                "avg_rank": int(row["avg_rank"]) if pd.notna(row["avg_rank"]) else None,
-                "net_rank": int(row["net_rank"]) if pd.notna(row["net_rank"]) else None,
-                "kenpom_rank": int(row["kenpom_rank"]) if pd.notna(row["kenpom_rank"]) else None,
-                "bpi_rank": int(row["bpi_rank"]) if pd.notna(row["bpi_rank"]) else None,
-                "sos_rank": int(row["sos_rank"]) if pd.notna(row["sos_rank"]) else None,
-            }
-        )
+    rank_cols = ["ap_rank", "avg_rank", "net_rank", "kenpom_rank", "bpi_rank", "sos_rank"]
+    columns = ["team", "record"] + rank_cols
+    values = [master_df["team"].tolist(), master_df["record"].fillna("").tolist()]
+    for col in rank_cols:
+        ranks = master_df[col].astype(object)
+        values.append(ranks.where(ranks.notna(), None).tolist())
+    records = [dict(zip(columns, row)) for row in zip(*values)]
 
     updated_str = _format_updated_est(datetime.now(timezone.utc))
     return {"updated": updated_str, "teams": records}
 
 
+def write_dashboard_json(path, dashboard_json):
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(dashboard_json))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dashboard_json, f, ensure_ascii=False, separators=(",", ":"))
+
+
 def main():
     print("Building site rankings...")
 
@@ -168,8 +170,7 @@ def main():
     os.makedirs("docs", exist_ok=True)
 
     dashboard_json = create_dashboard_json(master)
-    with open("docs/rankings.json", "w") as f:
-        json.dump(dashboard_json, f, indent=2)
+    write_dashboard_json("docs/rankings.json", dashboard_json)
     print("Saved docs/rankings.json")
 
     # FIX: index.html is no longer written here.
@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 import unicodedata
@@ -5,6 +6,11 @@ import pandas as pd
 
 TEAM_ALIAS_PATH = "team_alias.csv"
 
+_WS_RE = re.compile(r"\s+")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_BPI_AMP_RE = re.compile(r"\bA&\b")
+_BPI_ABBR_SUFFIX_RE = re.compile(r"^(.*?)([A-Z][A-Z0-9&'.-]{1,6})$")
+
 
 def _strip_diacritics(s: str) -> str:
     s = unicodedata.normalize("NFKD", s)
@@ -17,81 +23,127 @@ def _normalize_text(x) -> str:
     s = str(x)
     s = s.replace("\u2019", "'").replace("\u2018", "'").replace("\u201c", '"').replace("\u201d", '"')
     s = _strip_diacritics(s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 
+# The cleaners below are pure and see the same ~365 names over and over (every
+# source cleans the alias file's canonical column), so memoize them.
+@functools.lru_cache(maxsize=8192)
 def _clean_bpi_team_name(raw) -> str:
     s = _normalize_text(raw)
     if not s:
         return s
-    s = re.sub(r"\bA&\b", "A&M", s)
+    s = _BPI_AMP_RE.sub("A&M", s)
     s_nospace = s.replace(" ", "")
     if len(s_nospace) >= 6 and len(s_nospace) % 2 == 0:
         half = len(s_nospace) // 2
         if s_nospace[:half].upper() == s_nospace[half:].upper():
             return s_nospace[:half]
-    m = re.match(r"^(.*?)([A-Z][A-Z0-9&'.-]{1,6})$", s)
+    m = _BPI_ABBR_SUFFIX_RE.match(s)
     if m:
         base = m.group(1).strip()
         if len(base) >= 3:
             s = base
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 
+@functools.lru_cache(maxsize=8192)
 def _clean_generic_team_name(raw) -> str:
     s = _normalize_text(raw)
     if not s:
         return s
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 
+@functools.lru_cache(maxsize=8)
+def _read_team_alias(path: str, mtime_ns: int) -> pd.DataFrame:
+    df = pd.read_csv(path, dtype=str)
+    df.columns = [c.strip() for c in df.columns]
+    return df
+
+
 def load_team_alias(path: str = TEAM_ALIAS_PATH) -> pd.DataFrame:
     if not os.path.exists(path):
         return pd.DataFrame()
-    df = pd.read_csv(path)
-    df.columns = [c.strip() for c in df.columns]
-    return df
+    # keyed on mtime so an edited alias file is re-read; the shallow copy keeps the
+    # cached frame's columns and labels pristine without duplicating its data
+    return _read_team_alias(path, os.stat(path).st_mtime_ns).copy(deep=False)
+
+
+def _clean_fn_for(source: str):
+    return _clean_bpi_team_name if source.lower() == "bpi" else _clean_generic_team_name
+
+
+def _build_alias_lookup(alias_df: pd.DataFrame, source: str) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Return (exact, by_key) lookups. exact is keyed on the lowercased cleaned
+    name; by_key is keyed on its alphanumerics only, so punctuation and
+    spacing variants ("St Johns" vs "St. John's") still resolve. Keys that
+    would point at more than one canonical team are left out of by_key.
+    """
+    if alias_df.empty:
+        return {}, {}
+    canonical_col = None
+    for cand in ["team", "canonical_team", "canonical"]:
+        if cand in alias_df.columns:
+            canonical_col = cand
+            break
+    if canonical_col is None:
+        canonical_col = alias_df.columns[0]
+    canonical = alias_df[canonical_col].apply(_clean_generic_team_name)
+    keys = pd.DataFrame({"canonical": canonical})
+    if source in alias_df.columns:
+        keys["alias"] = alias_df[source].apply(_clean_fn_for(source))
+    keys = keys[canonical != ""]
+    # stack() is row-major, so later rows still win on key collisions
+    pairs = keys.stack()
+    pairs = pairs[pairs != ""]
+    exact = dict(zip(pairs.str.lower(), canonical.loc[pairs.index.get_level_values(0)]))
+
+    by_key: dict[str, str] = {}
+    ambiguous: set[str] = set()
+    for name, team in exact.items():
+        key = _NON_ALNUM_RE.sub("", name)
+        if by_key.setdefault(key, team) != team:
+            ambiguous.add(key)
+    for key in ambiguous:
+        del by_key[key]
+    return exact, by_key
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_alias_lookup(path: str, mtime_ns: int, source: str) -> tuple[dict[str, str], dict[str, str]]:
+    return _build_alias_lookup(_read_team_alias(path, mtime_ns), source)
+
+
+def _default_alias_lookup(source: str, path: str = TEAM_ALIAS_PATH) -> tuple[dict[str, str], dict[str, str]]:
+    if not os.path.exists(path):
+        return {}, {}
+    return _cached_alias_lookup(path, os.stat(path).st_mtime_ns, source)
 
 
 def standardize_team_names(df: pd.DataFrame, source_col: str, source: str, alias_df: pd.DataFrame | None = None) -> pd.DataFrame:
-    out = df.copy()
+    out = df.copy(deep=False)  # only a "team" column is added; the input's data is never written
     if source_col not in out.columns:
         raise ValueError(f"Column '{source_col}' not found in df")
     if alias_df is None:
-        alias_df = load_team_alias()
-
-    if source.lower() == "bpi":
-        clean_fn = _clean_bpi_team_name
+        exact, by_key = _default_alias_lookup(source)
     else:
-        clean_fn = _clean_generic_team_name
-
-    if not alias_df.empty:
-        canonical_col = None
-        for cand in ["team", "canonical_team", "canonical"]:
-            if cand in alias_df.columns:
-                canonical_col = cand
-                break
-        if canonical_col is None:
-            canonical_col = alias_df.columns[0]
-        source_col_in_alias = source if source in alias_df.columns else None
-        name_to_canonical: dict[str, str] = {}
-        for _, row in alias_df.iterrows():
-            canonical = _clean_generic_team_name(row.get(canonical_col, ""))
-            if not canonical:
-                continue
-            name_to_canonical[_clean_generic_team_name(canonical).lower()] = canonical
-            if source_col_in_alias:
-                raw_alias = row.get(source_col_in_alias, "")
-                if raw_alias is not None and not (isinstance(raw_alias, float) and pd.isna(raw_alias)):
-                    alias_clean = clean_fn(raw_alias)
-                    if alias_clean:
-                        name_to_canonical[alias_clean.lower()] = canonical
-    else:
-        name_to_canonical = {}
-
-    cleaned = out[source_col].apply(clean_fn)
-    out["team"] = cleaned.apply(lambda s: name_to_canonical.get(s.lower(), s))
+        exact, by_key = _build_alias_lookup(alias_df, source)
+    clean_fn = _clean_fn_for(source)
+
+    # clean and resolve each distinct raw name once, then broadcast back by code
+    codes, uniques = pd.factorize(out[source_col], use_na_sentinel=False)
+    cleaned = pd.Series(uniques).apply(clean_fn).astype(str)
+    lowered = cleaned.str.lower()
+    canonical_names = lowered.map(exact)
+    missing = canonical_names.isna()
+    if missing.any():
+        keys = lowered[missing].str.replace(_NON_ALNUM_RE, "", regex=True)
+        canonical_names[missing] = keys.map(by_key)
+    canonical_names = canonical_names.fillna(cleaned)
+    out["team"] = canonical_names.to_numpy()[codes]
     return out
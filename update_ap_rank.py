@@ -38,21 +38,51 @@ _AP_TO_CANONICAL: dict[str, str] = {
 }
 
 
-def _normalise(name: str) -> str:
-    s = re.sub(r"\s+", " ", name).strip()
-    return _AP_TO_CANONICAL.get(s, s)
+_WS_RE = re.compile(r"\s+")
+
+
+def _normalise(names: pd.Series) -> pd.Series:
+    s = names.str.replace(_WS_RE, " ", regex=True).str.strip()
+    return s.replace(_AP_TO_CANONICAL)
 
 
 # ---------------------------------------------------------------------------
 # Scraping helpers
 # ---------------------------------------------------------------------------
 
+# Compiled once: these run per table row / list item / text line.
+_RANK_RE = re.compile(r"\d{1,2}")
+_STARTS_ALPHA_RE = re.compile(r"^[A-Za-z]")
+_RECORD_SUFFIX_RE = re.compile(r"\s*\(?\d{1,2}-\d{1,2}\)?.*$")
+_VOTES_SUFFIX_RE = re.compile(r"\s*\d+\s*\(\d+\)\s*$")
+_LEADING_RANK_RE = re.compile(r"^\d{1,2}\.?\s*")
+_CONF_WORD_RE = re.compile(r"Big|Atlantic|SEC|ACC|Pac|Mountain|American")
+_CONF_SUFFIX_RE = re.compile(r"\s+(Big|Atlantic|SEC|ACC|Pac|Mountain|American).*$", re.IGNORECASE)
+_TABLE_TEAM_RE = re.compile(
+    r"^([A-Za-z][A-Za-z\s\.\'\(\)&]+?)(?:\s+\d{1,2}-\d{1,2}|\s+Big|\s+Atlantic|\s+SEC|\s+ACC|\s+Pac|\s+Mountain|\s+American|$)"
+)
+_LIST_CONF_SUFFIX_RE = re.compile(
+    r"\s+(Big|Atlantic|SEC|ACC|Pac|Mountain|American|West Coast|"
+    r"Missouri Valley|MAC|SBC|CUSA|Horizon|Ivy|Patriot|Southern|"
+    r"Southland|SWAC|OVC|Big South|Big Sky|Big West|Sun Belt|WAC|"
+    r"NEC|CAA|A-10|MWC|WCC|MVC).*$",
+    re.IGNORECASE,
+)
+_BARE_RECORD_RE = re.compile(r"\d+-\d+")
+_POINTS_RE = re.compile(r"\d+\s*\(\d+\)")
+_TREND_RE = re.compile(r"[▲▼↑↓\-\+]\s*\d*")
+_BARE_CONF_RE = re.compile(
+    r"(Big (12|Ten|East)|SEC|ACC|Pac-12|MWC|WCC|A-10|"
+    r"American|Mountain West|Big Sky|Big South|Big West)",
+    re.IGNORECASE,
+)
+
 def _clean_team_name(raw: str) -> str:
     """Strip record suffix and extra whitespace from a raw team name string."""
     # Remove trailing record like "23-0" or "(23-0)" or "23-0 (59)"
-    s = re.sub(r"\s*\(?\d{1,2}-\d{1,2}\)?.*$", "", raw)
+    s = _RECORD_SUFFIX_RE.sub("", raw)
     # Remove trailing vote/point totals like "1475 (59)"
-    s = re.sub(r"\s*\d+\s*\(\d+\)\s*$", "", s)
+    s = _VOTES_SUFFIX_RE.sub("", s)
     return s.strip()
 
 
@@ -65,7 +95,7 @@ def _try_table_method(soup: BeautifulSoup) -> list[dict]:
         if len(cells) < 2:
             continue
         rank_text = cells[0].get_text(strip=True)
-        if not re.fullmatch(r"\d{1,2}", rank_text):
+        if not _RANK_RE.fullmatch(rank_text):
             continue
         rank = int(rank_text)
         if rank < 1 or rank > 25 or rank in seen:
@@ -77,18 +107,15 @@ def _try_table_method(soup: BeautifulSoup) -> list[dict]:
         # Try links first
         for link in team_cell.find_all("a"):
             text = _clean_team_name(link.get_text(strip=True))
-            if text and len(text) >= 3 and re.match(r"^[A-Za-z]", text):
-                if not re.search(r"Big|Atlantic|SEC|ACC|Pac|Mountain|American", text):
+            if text and len(text) >= 3 and _STARTS_ALPHA_RE.match(text):
+                if not _CONF_WORD_RE.search(text):
                     team_name = text
                     break
 
         # Fallback: full cell text
         if not team_name:
             full = team_cell.get_text(" ", strip=True)
-            m = re.match(
-                r"^([A-Za-z][A-Za-z\s\.\'\(\)&]+?)(?:\s+\d{1,2}-\d{1,2}|\s+Big|\s+Atlantic|\s+SEC|\s+ACC|\s+Pac|\s+Mountain|\s+American|$)",
-                full,
-            )
+            m = _TABLE_TEAM_RE.match(full)
             if m:
                 team_name = m.group(1).strip()
 
@@ -114,19 +141,11 @@ def _try_ordered_list_method(soup: BeautifulSoup) -> list[dict]:
         for rank, li in enumerate(items[:25], start=1):
             text = li.get_text(" ", strip=True)
             # Strip leading rank number if the layout includes it
-            text = re.sub(r"^\d{1,2}\.?\s*", "", text).strip()
+            text = _LEADING_RANK_RE.sub("", text).strip()
             team = _clean_team_name(text)
             # Strip trailing conference name if glued on
-            team = re.sub(
-                r"\s+(Big|Atlantic|SEC|ACC|Pac|Mountain|American|West Coast|"
-                r"Missouri Valley|MAC|SBC|CUSA|Horizon|Ivy|Patriot|Southern|"
-                r"Southland|SWAC|OVC|Big South|Big Sky|Big West|Sun Belt|WAC|"
-                r"NEC|CAA|A-10|MWC|WCC|MVC).*$",
-                "",
-                team,
-                flags=re.IGNORECASE,
-            ).strip()
-            if team and len(team) >= 3 and re.match(r"^[A-Za-z]", team):
+            team = _LIST_CONF_SUFFIX_RE.sub("", team).strip()
+            if team and len(team) >= 3 and _STARTS_ALPHA_RE.match(team):
                 candidate_rows.append({"ap_rank": rank, "team_ap": team})
 
         if len(candidate_rows) >= 20:
@@ -152,7 +171,7 @@ def _try_text_method(soup: BeautifulSoup) -> list[dict]:
     while i < len(lines) - 1 and len(rows) < 25:
         ln = lines[i]
 
-        if re.fullmatch(r"\d{1,2}", ln):
+        if _RANK_RE.fullmatch(ln):
             rk = int(ln)
             # Allow same rank twice (ties), but stop at 25 total teams
             if 1 <= rk <= 25 and len(rows) < 25:
@@ -160,35 +179,25 @@ def _try_text_method(soup: BeautifulSoup) -> list[dict]:
                     candidate = lines[j]
 
                     # Hard skips — things that are definitely NOT team names
-                    if re.fullmatch(r"\d{1,2}", candidate):           # another rank
+                    if _RANK_RE.fullmatch(candidate):          # another rank
                         break
-                    if re.fullmatch(r"\d+-\d+", candidate):           # bare record
+                    if _BARE_RECORD_RE.fullmatch(candidate):   # bare record
                         continue
-                    if re.fullmatch(r"\d+\s*\(\d+\)", candidate):     # points (votes)
+                    if _POINTS_RE.fullmatch(candidate):        # points (votes)
                         continue
-                    if re.fullmatch(r"[▲▼↑↓\-\+]\s*\d*", candidate):  # trend arrow
+                    if _TREND_RE.fullmatch(candidate):         # trend arrow
                         continue
                     if len(candidate) < 3:
                         continue
                     # Bare conference names with no team name present
-                    if re.fullmatch(
-                        r"(Big (12|Ten|East)|SEC|ACC|Pac-12|MWC|WCC|A-10|"
-                        r"American|Mountain West|Big Sky|Big South|Big West)",
-                        candidate,
-                        re.IGNORECASE,
-                    ):
+                    if _BARE_CONF_RE.fullmatch(candidate):
                         continue
-                    if not re.match(r"^[A-Za-z]", candidate):
+                    if not _STARTS_ALPHA_RE.match(candidate):
                         continue
 
                     # Looks like a team name — clean and accept
                     team = _clean_team_name(candidate)
-                    team = re.sub(
-                        r"\s+(Big|Atlantic|SEC|ACC|Pac|Mountain|American).*$",
-                        "",
-                        team,
-                        flags=re.IGNORECASE,
-                    ).strip()
+                    team = _CONF_SUFFIX_RE.sub("", team).strip()
 
                     if team and len(team) >= 3:
                         # Skip if we already have this team (scrape artifact)
@@ -245,15 +254,15 @@ def scrape_ap_poll() -> pd.DataFrame | None:
     )
 
     # Normalise names to canonical
-    df["team_ap"] = df["team_ap"].apply(_normalise)
+    df["team_ap"] = _normalise(df["team_ap"])
 
     # With ties some rank numbers legitimately don't appear (e.g. two #23s means no #24)
     # Warn only if team count is below 25, not on missing rank numbers
     if len(df) < 25:
         print(f"  WARNING: only {len(df)} teams scraped (expected 25) — parser may need updating.")
 
-    for _, row in df.iterrows():
-        print(f"  {int(row['ap_rank'])}. {row['team_ap']}")
+    for rank, team in zip(df["ap_rank"], df["team_ap"]):
+        print(f"  {int(rank)}. {team}")
 
     return df
 
@@ -78,29 +78,21 @@ def _team_short_name(team_id: int, cache: dict[int, str]) -> str:
     return name
 
 
-def _find_projections_table_with_bpi_rk(html: str) -> pd.DataFrame:
+def _find_projections_table_with_bpi_rk(html: str) -> tuple[pd.DataFrame, object]:
     """
     Find the POWER INDEX PROJECTIONS table via read_html and return the table
-    that contains a "BPI RK" column.
+    that contains a "BPI RK" column, together with that column's label.
     """
     tables = pd.read_html(StringIO(html))
     for t in tables:
-        cols = [str(c).strip().upper() for c in t.columns]
-        if any("BPI RK" == c or c.endswith("BPI RK") or "BPI RK" in c for c in cols):
-            return t
+        for c in t.columns:
+            if "BPI RK" in str(c).upper():
+                return t, c
     raise RuntimeError("Could not locate projections table containing 'BPI RK'.")
 
 
 def _extract_bpi_ranks(html: str) -> pd.Series:
-    t = _find_projections_table_with_bpi_rk(html)
-
-    bpi_rk_col = None
-    for c in t.columns:
-        if "BPI RK" in str(c).upper():
-            bpi_rk_col = c
-            break
-    if bpi_rk_col is None:
-        raise RuntimeError("Found BPI table but could not identify the BPI RK column.")
+    t, bpi_rk_col = _find_projections_table_with_bpi_rk(html)
 
     ranks = pd.to_numeric(t[bpi_rk_col], errors="coerce").dropna().astype(int).reset_index(drop=True)
     return ranks
@@ -158,8 +150,8 @@ def _existing_file_ok(path: str) -> bool:
     if not os.path.exists(path):
         return False
     try:
-        df = pd.read_csv(path)
-        return {"bpi_rank", "team_bpi"}.issubset(df.columns) and len(df) >= 300 and df["team_bpi"].astype(str).str.len().mean() > 3
+        df = pd.read_csv(path, usecols=["bpi_rank", "team_bpi"], dtype={"bpi_rank": "Int64", "team_bpi": str})
+        return len(df) >= 300 and df["team_bpi"].str.len().mean() > 3
     except Exception:
         return False
 
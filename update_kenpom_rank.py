@@ -113,6 +113,12 @@ def normalise_kenpom_name(raw: str) -> str:
     return _KENPOM_TO_CANONICAL.get(name, name)
 
 
+def normalise_kenpom_names(names: pd.Series) -> pd.Series:
+    """Vectorised normalise_kenpom_name over a whole column."""
+    stripped = names.astype(str).str.strip().str.replace(_SUFFIX_RE, '', regex=True)
+    return stripped.replace(_KENPOM_TO_CANONICAL)
+
+
 # ---------------------------------------------------------------------------
 # Main scraping / loading logic  (replace the body below with your actual
 # scraper; the normalisation call at the end is what matters)
@@ -131,10 +137,10 @@ def fetch_kenpom_rankings() -> pd.DataFrame:
         print(f"WARNING: {raw_path} not found – skipping KenPom")
         return pd.DataFrame(columns=["kenpom_rank", "team_kenpom", "record"])
 
-    df = pd.read_csv(raw_path)
+    df = pd.read_csv(raw_path, dtype={"team_kenpom": str, "record": str})
 
     # Normalise team names in-place
-    df["team_kenpom"] = df["team_kenpom"].astype(str).apply(normalise_kenpom_name)
+    df["team_kenpom"] = normalise_kenpom_names(df["team_kenpom"])
 
     # Ensure rank is numeric
     df["kenpom_rank"] = pd.to_numeric(df["kenpom_rank"], errors="coerce")
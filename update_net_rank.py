@@ -9,6 +9,8 @@ import re
 from bs4 import BeautifulSoup
 import os
 
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
 def scrape_net_rankings():
     """Scrape NET rankings from NCAA website."""
     url = "https://www.ncaa.com/rankings/basketball-men/d1/ncaa-mens-basketball-net-rankings"
@@ -35,7 +37,7 @@ def scrape_net_rankings():
                 rank = cells[0].get_text(strip=True)
                 team = cells[1].get_text(strip=True)
                 
-                rank = re.sub(r'[^\d]', '', rank)
+                rank = _NON_DIGIT_RE.sub('', rank)
                 
                 if rank and team:
                     rows.append({
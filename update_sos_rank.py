@@ -9,6 +9,8 @@ import os
 import re
 from io import StringIO
 
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
 
 def scrape_sos_rankings():
     """Scrape SOS rankings from Warren Nolan."""
@@ -69,7 +71,7 @@ def scrape_sos_rankings():
                     rank_text = cells[2].get_text(strip=True)
                     
                     # Clean rank - extract just the number
-                    rank_clean = re.sub(r'[^\d]', '', rank_text)
+                    rank_clean = _NON_DIGIT_RE.sub('', rank_text)
                     
                     if team and rank_clean and rank_clean.isdigit():
                         rank = int(rank_clean)
@@ -96,8 +98,7 @@ def scrape_sos_rankings():
                     team_col = None
                     rank_col = None
                     
-                    for c in df.columns:
-                        c_lower = str(c).lower().strip()
+                    for c, c_lower in zip(df.columns, cols):
                         if 'team' in c_lower and team_col is None:
                             team_col = c
                         elif 'rank' in c_lower and rank_col is None: